@@ -3,6 +3,7 @@ try:
     import dtxt_rs
 except ImportError:
     dtxt_rs = None
+import gc
 import json
 import time
 import random
@@ -12,15 +13,16 @@ def generate_large_data(count):
     data = {
         "title": "DTXT vs JSON (JSON-native types only)",
         "description": "Benchmark for base format overhead (unquoted keys, short literals)",
-        "entries": []
     }
+    data["entries"] = entries = [None] * count
+    rnd = random.random
 
     for i in range(count):
-        data["entries"].append({
+        entries[i] = {
             "id": i,
             "uid": f"user-{i}",
             "isActive": i % 2 == 0,
-            "score": random.random() * 1000,
+            "score": rnd() * 1000,
             "tags": ["data", "benchmark", "storage", "json", "dtxt"],
             "meta": {
                 "level": i % 10,
@@ -32,11 +34,27 @@ def generate_large_data(count):
                     "c": "nested string"
                 }
             }
-        })
+        }
     return data
 
 DATASET_SIZE = 30000
 
+def time_avg_ms(fn, arg, iterations):
+    # Average time of fn(arg) in ms. The clock is read once around the whole
+    # loop, and GC is paused so collections triggered by the parsed objects
+    # don't land inside the measurement.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            fn(arg)
+        elapsed_ns = time.perf_counter_ns() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return elapsed_ns / 1e6 / iterations
+
 def run_benchmark():
     print(f"Generating dataset with {DATASET_SIZE} entries (JSON-native types only)...")
     raw_data = generate_large_data(DATASET_SIZE)
@@ -49,10 +67,11 @@ def run_benchmark():
     json_path = os.path.join(base_path, "bench_v2.json")
     dtxt_path = os.path.join(base_path, "bench_v2.dtxt")
 
-    with open(json_path, "w") as f:
-        f.write(json_str)
-    with open(dtxt_path, "w") as f:
-        f.write(dtxt_str)
+    # Encode once and write in binary mode, bypassing the text I/O layer
+    with open(json_path, "wb") as f:
+        f.write(json_str.encode("utf-8"))
+    with open(dtxt_path, "wb") as f:
+        f.write(dtxt_str.encode("utf-8"))
 
     json_size = os.path.getsize(json_path)
     dtxt_size = os.path.getsize(dtxt_path)
@@ -67,48 +86,45 @@ def run_benchmark():
 
     print("\n--- Parsing Performance (Average of 5 runs) ---")
 
-    json_parse_total = 0
-    for _ in range(iterations):
-        start = time.perf_counter()
-        json.loads(json_str)
-        json_parse_total += (time.perf_counter() - start) * 1000
-    print(f"json.loads:     {json_parse_total / iterations:.2f} ms")
+    json_parse_ms = time_avg_ms(json.loads, json_str, iterations)
+    print(f"json.loads:     {json_parse_ms:.2f} ms")
 
     # Force pure Python for comparison
     original_rs = dtxt.dtxt_rs
+    original_cy = dtxt.dtxt_cy
     dtxt.dtxt_rs = None
-    pure_python_parse_total = 0
-    for _ in range(iterations):
-        start = time.perf_counter()
-        dtxt.loads(dtxt_str)
-        pure_python_parse_total += (time.perf_counter() - start) * 1000
-    print(f"dtxt.loads (Pure Python): {pure_python_parse_total / iterations:.2f} ms")
+    dtxt.dtxt_cy = None
+    pure_python_parse_ms = time_avg_ms(dtxt.loads, dtxt_str, iterations)
+    print(f"dtxt.loads (Pure Python): {pure_python_parse_ms:.2f} ms")
+
+    if original_cy:
+        dtxt.dtxt_cy = original_cy
+        cython_ext_parse_ms = time_avg_ms(dtxt.loads, dtxt_str, iterations)
+        print(f"dtxt.loads (Cython Ext):  {cython_ext_parse_ms:.2f} ms")
+        print(f"Speedup: {pure_python_parse_ms / cython_ext_parse_ms:.1f}x")
     dtxt.dtxt_rs = original_rs
 
     if dtxt.dtxt_rs:
-        rust_ext_parse_total = 0
-        for _ in range(iterations):
-            start = time.perf_counter()
-            dtxt.loads(dtxt_str)
-            rust_ext_parse_total += (time.perf_counter() - start) * 1000
-        print(f"dtxt.loads (Rust Ext):    {rust_ext_parse_total / iterations:.2f} ms")
-        print(f"Speedup: {pure_python_parse_total / rust_ext_parse_total:.1f}x")
+        rust_ext_parse_ms = time_avg_ms(dtxt.loads, dtxt_str, iterations)
+        print(f"dtxt.loads (Rust Ext):    {rust_ext_parse_ms:.2f} ms")
+        print(f"Speedup: {pure_python_parse_ms / rust_ext_parse_ms:.1f}x")
 
     print("\n--- Serialization Performance (Average of 5 runs) ---")
 
-    json_stringify_total = 0
-    for _ in range(iterations):
-        start = time.perf_counter()
-        json.dumps(raw_data)
-        json_stringify_total += (time.perf_counter() - start) * 1000
-    print(f"json.dumps:  {json_stringify_total / iterations:.2f} ms")
-
-    dtxt_stringify_total = 0
-    for _ in range(iterations):
-        start = time.perf_counter()
-        dtxt.dumps(raw_data)
-        dtxt_stringify_total += (time.perf_counter() - start) * 1000
-    print(f"dtxt.dumps:   {dtxt_stringify_total / iterations:.2f} ms")
+    json_stringify_ms = time_avg_ms(json.dumps, raw_data, iterations)
+    print(f"json.dumps:  {json_stringify_ms:.2f} ms")
+
+    # Force pure Python for comparison
+    dtxt.dtxt_cy = None
+    pure_python_stringify_ms = time_avg_ms(dtxt.dumps, raw_data, iterations)
+    print(f"dtxt.dumps (Pure Python): {pure_python_stringify_ms:.2f} ms")
+
+    if original_cy:
+        dtxt.dtxt_cy = original_cy
+        cython_ext_stringify_ms = time_avg_ms(dtxt.dumps, raw_data, iterations)
+        print(f"dtxt.dumps (Cython Ext):  {cython_ext_stringify_ms:.2f} ms")
+        print(f"Speedup: {pure_python_stringify_ms / cython_ext_stringify_ms:.1f}x")
+    dtxt.dtxt_cy = original_cy
 
 if __name__ == "__main__":
     run_benchmark()
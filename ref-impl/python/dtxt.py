@@ -1,245 +1,411 @@
-import re
+import sys
 from datetime import datetime, date
-import decimal
-import binascii
+
+# Compiled backends; load/dumps try these before the pure-Python code below
+try:
+    import dtxt_rs
+except ImportError:
+    dtxt_rs = None
+
+try:
+    # Optional Cython build of the parser/serializer (see dtxt_cy.pyx)
+    import dtxt_cy
+except ImportError:
+    dtxt_cy = None
 
 class DTXTError(Exception):
     pass
 
-class DTXTLexer:
-    TOKEN_SPEC = [
-        ('COMMENT',   r'//.*'),
-        ('STRING',    r'`[^`]*`'),
-        ('CONSTRUCTOR', r'[A-Za-z0-9_]+\([^() \t\n\r]*\)'),
-        ('BRACE_OPEN', r'\{'),
-        ('BRACE_CLOSE', r'\}'),
-        ('BRACKET_OPEN', r'\['),
-        ('BRACKET_CLOSE', r'\]'),
-        ('COLON',     r':'),
-        ('COMMA',     r','),
-        ('NUMBER',    r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?(?![A-Za-z0-9_])'),
-        ('BOOL_T',    r'T'),
-        ('BOOL_F',    r'F'),
-        ('NULL_N',    r'N'),
-        ('KEY',       r'[A-Za-z0-9_]+'),
-        ('WHITESPACE', r'[ \t\r\n]+'),
-        ('MISMATCH',  r'.'),
-    ]
-    
-    def __init__(self, text):
-        self.tokens = []
-        self.pos = 0
-        self.text = text
-        regex = '|'.join('(?P<%s>%s)' % pair for pair in self.TOKEN_SPEC)
-        for mo in re.finditer(regex, text):
-            kind = mo.lastgroup
-            value = mo.group()
-            if kind == 'WHITESPACE' or kind == 'COMMENT':
-                continue
-            elif kind == 'MISMATCH':
-                raise DTXTError(f"Unexpected character: {value!r}")
-            self.tokens.append((kind, value))
-        self.tokens.append(('EOF', None))
+_DIGITS = frozenset('0123456789')
+_IDENT_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_')
+_WHITESPACE = frozenset(' \t\r\n')
+# Characters that may not appear inside a constructor payload
+_PAYLOAD_STOP = frozenset('() \t\r\n')
 
+def _skip(text, pos, n):
+    # Skips whitespace and // line comments; returns the next position
+    while pos < n:
+        ch = text[pos]
+        if ch in _WHITESPACE:
+            pos += 1
+        elif ch == '/':
+            if not text.startswith('//', pos):
+                raise DTXTError("Unexpected character: '/'")
+            end = text.find('\n', pos)
+            pos = n if end < 0 else end
+        else:
+            break
+    return pos
+
+def _is_iso_date(payload):
+    # YYYY-MM-DD only: on 3.11+ date.fromisoformat also takes forms such as
+    # 20260115 and 2026-W03-4, which must stay strings on every version
+    return (len(payload) == 10 and payload[4] == '-' and payload[7] == '-'
+            and payload.isascii() and (payload[:4] + payload[5:7] + payload[8:]).isdigit())
+
+# Single-pass recursive-descent parser: there is no separate token stream,
+# each parse_* method consumes its input starting at self.pos directly.
+# The object/array loops keep the cursor in a local and only sync self.pos
+# around calls into other parse_* methods.
 class DTXTParser:
-    def __init__(self, tokens):
-        self.tokens = tokens
-        self.pos = 0
 
-    def peek(self):
-        return self.tokens[self.pos]
+    def __init__(self, text):
+        self.text = text
+        self.pos = 0
+        self.length = len(text)
+        # Keys seen in this document, so repeated keys share one interned str
+        self.keys = {}
 
-    def consume(self, expected_kind=None):
-        kind, value = self.tokens[self.pos]
-        if expected_kind and kind != expected_kind:
-            raise DTXTError(f"Expected {expected_kind}, got {kind}")
-        self.pos += 1
-        return value
+    def _describe(self, pos):
+        if pos >= self.length:
+            return 'end of input'
+        return repr(self.text[pos])
 
     def parse(self):
         # Root must be an object
+        text = self.text
+        n = self.length
+        pos = _skip(text, 0, n)
+        if pos >= n or text[pos] != '{':
+            raise DTXTError(f"Root must be an object, got {self._describe(pos)}")
+        self.pos = pos
         result = self.parse_object()
-        if self.peek()[0] != 'EOF':
-            raise DTXTError(f"Trailing data after root object: {self.peek()[0]}")
+        pos = _skip(text, self.pos, n)
+        if pos < n:
+            raise DTXTError(f"Trailing data after root object: {self._describe(pos)}")
         return result
 
     def parse_value(self):
-        kind, value = self.peek()
-        if kind == 'BRACE_OPEN':
-            return self.parse_object()
-        elif kind == 'BRACKET_OPEN':
-            return self.parse_array()
-        elif kind == 'STRING':
-            self.consume()
-            return value[1:-1] # Remove backticks
-        elif kind == 'NUMBER':
-            self.consume()
-            if '.' in value or 'e' in value or 'E' in value:
-                return float(value)
-            return int(value)
-        elif kind == 'BOOL_T':
-            self.consume()
-            return True
-        elif kind == 'BOOL_F':
-            self.consume()
-            return False
-        elif kind == 'NULL_N':
-            self.consume()
-            return None
-        elif kind == 'CONSTRUCTOR':
-            self.consume()
-            return self.parse_constructor(value)
-        else:
-            raise DTXTError(f"Unexpected token in value position: {kind} ({value})")
+        # self.pos is on the first character of the value
+        pos = self.pos
+        if pos >= self.length:
+            raise DTXTError("Unexpected end of input in value position")
+        code = ord(self.text[pos])
+        handler = _VALUE_DISPATCH[code] if code < 128 else None
+        if handler is None:
+            raise DTXTError(f"Unexpected character in value position: {self.text[pos]!r}")
+        return handler(self)
 
     def parse_object(self):
-        self.consume('BRACE_OPEN')
+        # self.pos is on the opening '{'
+        text = self.text
+        n = self.length
+        keys = self.keys
         obj = {}
-        while self.peek()[0] != 'BRACE_CLOSE':
-            # Keys are identifiers (KEY)
-            # They could also be T, F, N if used as keys
-            kind, key = self.peek()
-            if kind not in ('KEY', 'BOOL_T', 'BOOL_F', 'NULL_N'):
-                raise DTXTError(f"Expected key, got {kind}")
-            self.consume()
-            
-            if key in obj:
-                raise DTXTError(f"Duplicate key: {key}")
-            
-            self.consume('COLON')
-            value = self.parse_value()
-            obj[key] = value
-            
-            if self.peek()[0] == 'COMMA':
-                self.consume('COMMA')
-            elif self.peek()[0] != 'BRACE_CLOSE':
-                raise DTXTError(f"Expected ',' or '}}' in object, got {self.peek()[0]}")
-        
-        self.consume('BRACE_CLOSE')
-        return obj
+        # A repeated key overwrites instead of growing obj, so comparing the
+        # entry count at '}' detects duplicates without a lookup per key
+        count = 0
+        pos = _skip(text, self.pos + 1, n)
+        while True:
+            if pos < n and text[pos] == '}':
+                self.pos = pos + 1
+                if len(obj) != count:
+                    raise DTXTError("Duplicate key in object")
+                return obj
+
+            # Keys are identifiers: [A-Za-z0-9_]+ (T, F, N and leading digits included)
+            end = pos
+            while end < n and text[end] in _IDENT_CHARS:
+                end += 1
+            if end == pos:
+                raise DTXTError(f"Expected key, got {self._describe(pos)}")
+            key = text[pos:end]
+            cached = keys.get(key)
+            if cached is None:
+                cached = keys[key] = sys.intern(key)
+
+            pos = _skip(text, end, n)
+            if pos >= n or text[pos] != ':':
+                raise DTXTError(f"Expected ':', got {self._describe(pos)}")
+            self.pos = _skip(text, pos + 1, n)
+            obj[cached] = self.parse_value()
+            count += 1
+
+            pos = _skip(text, self.pos, n)
+            if pos < n and text[pos] == ',':
+                pos = _skip(text, pos + 1, n)
+            elif pos >= n or text[pos] != '}':
+                raise DTXTError(f"Expected ',' or '}}' in object, got {self._describe(pos)}")
 
     def parse_array(self):
-        self.consume('BRACKET_OPEN')
+        # self.pos is on the opening '['
+        text = self.text
+        n = self.length
         arr = []
-        while self.peek()[0] != 'BRACKET_CLOSE':
-            value = self.parse_value()
-            arr.append(value)
-            
-            if self.peek()[0] == 'COMMA':
-                self.consume('COMMA')
-            elif self.peek()[0] != 'BRACKET_CLOSE':
-                raise DTXTError(f"Expected ',' or ']' in array, got {self.peek()[0]}")
-                
-        self.consume('BRACKET_CLOSE')
-        return arr
-
-    def parse_constructor(self, full_value):
-        # TypeName(payload)
-        match = re.match(r'([A-Za-z0-9_]+)\((.*)\)', full_value)
-        if not match:
-             raise DTXTError(f"Invalid constructor format: {full_value}")
-        type_name, payload = match.groups()
-        
+        append = arr.append
+        pos = _skip(text, self.pos + 1, n)
+        while True:
+            if pos < n and text[pos] == ']':
+                self.pos = pos + 1
+                return arr
+
+            self.pos = pos
+            append(self.parse_value())
+
+            pos = _skip(text, self.pos, n)
+            if pos < n and text[pos] == ',':
+                pos = _skip(text, pos + 1, n)
+            elif pos >= n or text[pos] != ']':
+                raise DTXTError(f"Expected ',' or ']' in array, got {self._describe(pos)}")
+
+    def parse_string(self):
+        # Raw string between backticks; no escapes
+        text = self.text
+        end = text.find('`', self.pos + 1)
+        if end < 0:
+            raise DTXTError("Unterminated string")
+        value = text[self.pos + 1:end]
+        self.pos = end + 1
+        return value
+
+    def parse_number(self):
+        # -?(0|[1-9][0-9]*)(.[0-9]+)?([eE][+-]?[0-9]+)?
+        text = self.text
+        n = self.length
+        start = self.pos
+        is_float = False
+        j = start + 1 if text[start] == '-' else start
+        if j < n and text[j] == '0':
+            j += 1
+        elif j < n and text[j] in _DIGITS:
+            j += 1
+            while j < n and text[j] in _DIGITS:
+                j += 1
+        else:
+            raise DTXTError(f"Invalid number: {text[start:j + 1]}")
+        if j + 1 < n and text[j] == '.' and text[j + 1] in _DIGITS:
+            is_float = True
+            j += 2
+            while j < n and text[j] in _DIGITS:
+                j += 1
+        if j < n and text[j] in 'eE':
+            k = j + 1
+            if k < n and text[k] in '+-':
+                k += 1
+            if k < n and text[k] in _DIGITS:
+                is_float = True
+                j = k + 1
+                while j < n and text[j] in _DIGITS:
+                    j += 1
+        if j < n and (text[j] in _IDENT_CHARS or text[j] == '(' or text[j] == '.'):
+            raise DTXTError(f"Invalid number: {text[start:j + 1]}")
+        self.pos = j
+        if is_float:
+            return float(text[start:j])
+        return int(text[start:j])
+
+    def parse_word(self):
+        # T, F, N or a TypeName(payload) constructor
+        text = self.text
+        n = self.length
+        start = end = self.pos
+        while end < n and text[end] in _IDENT_CHARS:
+            end += 1
+        if end < n and text[end] == '(':
+            close = text.find(')', end)
+            if close < 0:
+                raise DTXTError(f"Unterminated constructor: {text[start:end]}")
+            if not _PAYLOAD_STOP.isdisjoint(text[end + 1:close]):
+                raise DTXTError(f"Invalid constructor payload: {text[start:close + 1]}")
+            self.pos = close + 1
+            return self.parse_constructor(text[start:end], text[end + 1:close])
+        self.pos = end
+        word = text[start:end]
+        if word == 'T':
+            return True
+        elif word == 'F':
+            return False
+        elif word == 'N':
+            return None
+        raise DTXTError(f"Unexpected identifier in value position: {word}")
+
+    def parse_constructor(self, type_name, payload):
+        # TypeName(payload), already split by parse_word
         if type_name == 'D':
             # ISO 8601
             try:
                 # Try full datetime first
                 if 'T' in payload:
                     return datetime.fromisoformat(payload.replace('Z', '+00:00'))
+                elif _is_iso_date(payload):
+                    return date.fromisoformat(payload)
                 else:
-                    return datetime.strptime(payload, '%Y-%m-%d').date()
+                    return payload
             except Exception:
                 # Specs say DTXT doesn't validate ISO correctness but parsers should return native types
                 return payload # Fallback or keep as string if invalid? Let's return payload for now or raise if we want strictness.
         elif type_name == 'BN':
-            if not re.match(r'^-?[0-9]+$', payload):
+            digits = payload[1:] if payload.startswith('-') else payload
+            if not (digits.isascii() and digits.isdigit()):
                  raise DTXTError(f"Invalid BN payload: {payload}")
             return int(payload)
         elif type_name == 'B':
-            try:
-                return binascii.unhexlify(payload)
-            except Exception:
+            # fromhex skips any ASCII whitespace (e.g. \x0b, \x0c), so only let
+            # letters/digits through; it then rejects the non-hex letters
+            if not (payload.isascii() and payload.isalnum()):
                 raise DTXTError(f"Invalid B(hex) payload: {payload}")
+            try:
+                return bytes.fromhex(payload)
+            except ValueError as e:
+                raise DTXTError(f"Invalid B(hex) payload: {payload}") from e
         else:
             raise DTXTError(f"Unknown constructor: {type_name}")
 
-try:
-    import dtxt_rs
-except ImportError:
-    dtxt_rs = None
+# parse_value handler for each ASCII first character of a value
+_VALUE_DISPATCH = [None] * 128
+_VALUE_DISPATCH[ord('{')] = DTXTParser.parse_object
+_VALUE_DISPATCH[ord('[')] = DTXTParser.parse_array
+_VALUE_DISPATCH[ord('`')] = DTXTParser.parse_string
+for _ch in '-0123456789':
+    _VALUE_DISPATCH[ord(_ch)] = DTXTParser.parse_number
+for _ch in 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_':
+    _VALUE_DISPATCH[ord(_ch)] = DTXTParser.parse_word
+del _ch
 
 def load(dtxt_text):
+    # Default path: dtxt_rs, then dtxt_cy, then DTXTParser
     if dtxt_rs:
         try:
             return dtxt_rs.loads(dtxt_text)
         except Exception:
             # Fallback to pure Python on error or nested constructors not handled by simplified Rust PyO3 bridge
             pass
-            
-    lexer = DTXTLexer(dtxt_text)
-    parser = DTXTParser(lexer.tokens)
-    return parser.parse()
+
+    if dtxt_cy:
+        try:
+            return dtxt_cy.loads(dtxt_text)
+        except Exception:
+            # The pure-Python parser reports the DTXTError with full context
+            pass
+
+    return DTXTParser(dtxt_text).parse()
 
 def loads(dtxt_text):
     return load(dtxt_text)
 
-def dumps(obj):
+def _write(obj, out, sort_keys):
+    # Appends the DTXT fragments for obj to out; dumps joins them once
     if isinstance(obj, dict):
-        items = []
-        # Keys must be sorted for canonicality if we want determinism
-        for k in sorted(obj.keys()):
-            v = obj[k]
-            items.append(f"{k}: {dumps(v)}")
-        return "{" + ", ".join(items) + "}"
+        out.append("{")
+        sep = ""
+        # Insertion order by default; dumps_canonical sorts for determinism
+        for k, v in (sorted(obj.items()) if sort_keys else obj.items()):
+            out.append(sep)
+            # Non-str keys are written via str(), as the f-string version did
+            out.append(k if type(k) is str else str(k))
+            out.append(": ")
+            _write(v, out, sort_keys)
+            sep = ", "
+        out.append("}")
     elif isinstance(obj, list):
-        items = [dumps(element) for element in obj]
-        return "[" + ", ".join(items) + "]"
+        # Fast path for lists of only ints (bool excluded by the exact type
+        # check) or only strs: format in one join instead of recursing
+        if obj:
+            t = type(obj[0])
+            if t is int and all(type(x) is int for x in obj):
+                out.append("[" + ", ".join(map(str, obj)) + "]")
+                return
+            if t is str:
+                # join raises TypeError on the first non-str element
+                try:
+                    out.append("[`" + "`, `".join(obj) + "`]")
+                    return
+                except TypeError:
+                    pass
+        out.append("[")
+        sep = ""
+        for element in obj:
+            out.append(sep)
+            _write(element, out, sort_keys)
+            sep = ", "
+        out.append("]")
     elif isinstance(obj, str):
         # Backticked string
-        return f"`{obj}`"
+        out.append("`")
+        out.append(obj)
+        out.append("`")
     elif isinstance(obj, bool):
-        return "T" if obj else "F"
-    elif isinstance(obj, type(None)):
-        return "N"
+        out.append("T" if obj else "F")
+    elif obj is None:
+        out.append("N")
     elif isinstance(obj, (int, float)):
         # Check if it was a BN or large int
-        return str(obj)
+        out.append(str(obj))
     elif isinstance(obj, (datetime, date)):
-        if hasattr(obj, 'isoformat'):
-            val = obj.isoformat()
-            if isinstance(obj, datetime) and obj.tzinfo:
-                val = val.replace('+00:00', 'Z')
-            return f"D({val})"
-        return f"D({obj})"
+        val = obj.isoformat()
+        if isinstance(obj, datetime) and obj.tzinfo:
+            val = val.replace('+00:00', 'Z')
+        out.append(f"D({val})")
     elif isinstance(obj, bytes):
-        return f"B({obj.hex().upper()})"
+        out.append(f"B({obj.hex().upper()})")
     else:
         raise DTXTError(f"Unsupported type for serialization: {type(obj)}")
 
+def dumps(obj):
+    # Keys are written in dict insertion order (as json.dumps does); use
+    # dumps_canonical for sorted, deterministic output.
+    if dtxt_cy:
+        try:
+            return dtxt_cy.dumps(obj)
+        except Exception:
+            pass
+
+    out = []
+    _write(obj, out, False)
+    return "".join(out)
+
 def dumps_canonical(obj, indent=None):
     # For now, let's keep it simple. Canonical usually implies no extra space.
     # But for human readability, we might want indent.
     # The spec says "Avoid unnecessary whitespace" for canonical output.
     if indent is None:
-        return dumps(obj)
+        out = []
+        _write(obj, out, True)
+        return "".join(out)
     
-    # Recursive indent version
-    def _dump(o, level):
-        sp = "  " * level
-        if isinstance(o, dict):
-            if not o: return "{}"
-            items = []
-            for k in sorted(o.keys()):
-                v = o[k]
-                items.append(f"{sp}  {k}: {_dump(v, level + 1)}")
-            return "{\n" + ",\n".join(items) + ",\n" + sp + "}"
-        elif isinstance(o, list):
-            if not o: return "[]"
-            items = []
-            for item in o:
-                items.append(f"{sp}  {_dump(item, level + 1)}")
-            return "[\n" + ",\n".join(items) + ",\n" + sp + "]"
+    # Indented version, driven by an explicit stack of open containers
+    # instead of recursion. Each frame is (iterator over children, indent,
+    # closing text, is_dict); scalar children are written straight to out
+    # and only non-empty dicts/lists get a frame of their own.
+    out = []
+    append = out.append
+    if not ((isinstance(obj, dict) or isinstance(obj, list)) and obj):
+        _write(obj, out, True)
+        return "".join(out)
+
+    if isinstance(obj, dict):
+        append("{\n")
+        stack = [(iter(sorted(obj.items())), "", "}", True)]
+    else:
+        append("[\n")
+        stack = [(iter(obj), "", "]", False)]
+    while stack:
+        it, sp, close, is_dict = stack[-1]
+        child_sp = sp + "  "
+        for item in it:
+            if is_dict:
+                k, v = item
+                append(f"{child_sp}{k}: ")
+            else:
+                v = item
+                append(child_sp)
+            t = type(v)
+            if t is str:
+                append("`" + v + "`,\n")
+            elif t is int or t is float:
+                append(str(v) + ",\n")
+            elif (isinstance(v, dict) or isinstance(v, list)) and v:
+                if isinstance(v, dict):
+                    append("{\n")
+                    stack.append((iter(sorted(v.items())), child_sp, child_sp + "}", True))
+                else:
+                    append("[\n")
+                    stack.append((iter(v), child_sp, child_sp + "]", False))
+                break
+            else:
+                _write(v, out, True)
+                append(",\n")
         else:
-            return dumps(o)
-            
-    return _dump(obj, 0)
+            stack.pop()
+            append(close + ",\n" if stack else close)
+    return "".join(out)
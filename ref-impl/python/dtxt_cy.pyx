@@ -0,0 +1,323 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+#
+# Optional compiled fast path for dtxt.loads / dtxt.dumps, for environments
+# without a Rust toolchain for dtxt_rs. Build in place with:
+#
+#     cythonize -i dtxt_cy.pyx
+#
+# dtxt.py falls back to the pure-Python implementation whenever this module
+# is missing or raises, so errors here are plain ValueError/TypeError and the
+# pure-Python parser reports the DTXTError.
+
+import sys
+from datetime import datetime, date
+
+from cpython.unicode cimport PyUnicode_READ_CHAR
+
+# cdef functions recurse on the C stack without Python's recursion check, so
+# nesting is capped here. Deeper input raises ValueError and dtxt.py falls
+# back to the pure-Python code, which raises a catchable RecursionError.
+cdef enum:
+    MAX_DEPTH = 1000
+
+cdef inline bint _is_digit(Py_UCS4 ch):
+    return u'0' <= ch <= u'9'
+
+cdef inline bint _is_ident(Py_UCS4 ch):
+    return (u'a' <= ch <= u'z') or (u'A' <= ch <= u'Z') or (u'0' <= ch <= u'9') or ch == u'_'
+
+
+cdef inline bint _is_iso_date(unicode payload):
+    # YYYY-MM-DD only, matching dtxt._is_iso_date
+    return (len(payload) == 10 and payload[4] == u'-' and payload[7] == u'-'
+            and payload.isascii() and (payload[:4] + payload[5:7] + payload[8:]).isdigit())
+
+
+cdef object _constructor(unicode type_name, unicode payload):
+    if type_name == u'D':
+        try:
+            if u'T' in payload:
+                return datetime.fromisoformat(payload.replace(u'Z', u'+00:00'))
+            if _is_iso_date(payload):
+                return date.fromisoformat(payload)
+            return payload
+        except Exception:
+            return payload
+    elif type_name == u'BN':
+        digits = payload[1:] if payload.startswith(u'-') else payload
+        if not (digits.isascii() and digits.isdigit()):
+            raise ValueError(f"Invalid BN payload: {payload}")
+        return int(payload)
+    elif type_name == u'B':
+        # Same check as dtxt.py: fromhex would skip ASCII whitespace
+        if not (payload.isascii() and payload.isalnum()):
+            raise ValueError(f"Invalid B(hex) payload: {payload}")
+        return bytes.fromhex(payload)
+    raise ValueError(f"Unknown constructor: {type_name}")
+
+
+cdef class _Parser:
+    cdef unicode text
+    cdef Py_ssize_t pos
+    cdef Py_ssize_t n
+    cdef dict keys
+    cdef Py_ssize_t depth
+
+    def __cinit__(self, unicode text):
+        self.text = text
+        self.pos = 0
+        self.n = len(text)
+        self.keys = {}
+        self.depth = 0
+
+    cdef inline Py_UCS4 peek(self):
+        # 0 at end of input; NUL is never valid outside strings and comments
+        if self.pos < self.n:
+            return PyUnicode_READ_CHAR(self.text, self.pos)
+        return 0
+
+    cdef int skip_ws(self) except -1:
+        cdef Py_UCS4 ch
+        cdef Py_ssize_t end
+        while self.pos < self.n:
+            ch = PyUnicode_READ_CHAR(self.text, self.pos)
+            if ch == u' ' or ch == u'\t' or ch == u'\r' or ch == u'\n':
+                self.pos += 1
+            elif (ch == u'/' and self.pos + 1 < self.n
+                    and PyUnicode_READ_CHAR(self.text, self.pos + 1) == u'/'):
+                end = self.text.find(u'\n', self.pos)
+                self.pos = self.n if end < 0 else end
+            else:
+                break
+        return 0
+
+    cdef object parse(self):
+        self.skip_ws()
+        if self.peek() != u'{':
+            raise ValueError("Root must be an object")
+        result = self.parse_object()
+        self.skip_ws()
+        if self.pos < self.n:
+            raise ValueError("Trailing data after root object")
+        return result
+
+    cdef object parse_value(self):
+        self.skip_ws()
+        cdef Py_UCS4 ch = self.peek()
+        if ch == u'{':
+            return self.parse_object()
+        elif ch == u'[':
+            return self.parse_array()
+        elif ch == u'`':
+            return self.parse_string()
+        elif ch == u'-' or _is_digit(ch):
+            return self.parse_number()
+        elif _is_ident(ch):
+            return self.parse_word()
+        raise ValueError("Unexpected character in value position")
+
+    cdef dict parse_object(self):
+        cdef dict obj = {}
+        cdef unicode key
+        cdef Py_UCS4 ch
+        cdef Py_ssize_t count = 0
+        self.depth += 1
+        if self.depth > MAX_DEPTH:
+            raise ValueError("Maximum nesting depth exceeded")
+        self.pos += 1  # {
+        while True:
+            self.skip_ws()
+            ch = self.peek()
+            if ch == u'}':
+                self.pos += 1
+                if len(obj) != count:
+                    raise ValueError("Duplicate key in object")
+                self.depth -= 1
+                return obj
+            key = self.parse_key()
+            self.skip_ws()
+            if self.peek() != u':':
+                raise ValueError("Expected ':'")
+            self.pos += 1
+            obj[key] = self.parse_value()
+            count += 1
+            self.skip_ws()
+            ch = self.peek()
+            if ch == u',':
+                self.pos += 1
+            elif ch != u'}':
+                raise ValueError("Expected ',' or '}' in object")
+
+    cdef unicode parse_key(self):
+        cdef Py_ssize_t start = self.pos
+        cdef Py_ssize_t end = start
+        while end < self.n and _is_ident(PyUnicode_READ_CHAR(self.text, end)):
+            end += 1
+        if end == start:
+            raise ValueError("Expected key")
+        self.pos = end
+        key = self.text[start:end]
+        cached = self.keys.get(key)
+        if cached is None:
+            cached = self.keys[key] = sys.intern(key)
+        return cached
+
+    cdef list parse_array(self):
+        cdef list arr = []
+        cdef Py_UCS4 ch
+        self.depth += 1
+        if self.depth > MAX_DEPTH:
+            raise ValueError("Maximum nesting depth exceeded")
+        self.pos += 1  # [
+        while True:
+            self.skip_ws()
+            ch = self.peek()
+            if ch == u']':
+                self.pos += 1
+                self.depth -= 1
+                return arr
+            arr.append(self.parse_value())
+            self.skip_ws()
+            ch = self.peek()
+            if ch == u',':
+                self.pos += 1
+            elif ch != u']':
+                raise ValueError("Expected ',' or ']' in array")
+
+    cdef unicode parse_string(self):
+        cdef Py_ssize_t end = self.text.find(u'`', self.pos + 1)
+        if end < 0:
+            raise ValueError("Unterminated string")
+        value = self.text[self.pos + 1:end]
+        self.pos = end + 1
+        return value
+
+    cdef object parse_number(self):
+        # -?(0|[1-9][0-9]*)(.[0-9]+)?([eE][+-]?[0-9]+)?
+        cdef unicode text = self.text
+        cdef Py_ssize_t n = self.n
+        cdef Py_ssize_t start = self.pos
+        cdef Py_ssize_t j = start
+        cdef Py_ssize_t k
+        cdef Py_UCS4 ch
+        cdef bint is_float = False
+        if PyUnicode_READ_CHAR(text, j) == u'-':
+            j += 1
+        if j < n and PyUnicode_READ_CHAR(text, j) == u'0':
+            j += 1
+        elif j < n and _is_digit(PyUnicode_READ_CHAR(text, j)):
+            j += 1
+            while j < n and _is_digit(PyUnicode_READ_CHAR(text, j)):
+                j += 1
+        else:
+            raise ValueError("Invalid number")
+        if (j + 1 < n and PyUnicode_READ_CHAR(text, j) == u'.'
+                and _is_digit(PyUnicode_READ_CHAR(text, j + 1))):
+            is_float = True
+            j += 2
+            while j < n and _is_digit(PyUnicode_READ_CHAR(text, j)):
+                j += 1
+        if j < n and (PyUnicode_READ_CHAR(text, j) == u'e' or PyUnicode_READ_CHAR(text, j) == u'E'):
+            k = j + 1
+            if k < n and (PyUnicode_READ_CHAR(text, k) == u'+' or PyUnicode_READ_CHAR(text, k) == u'-'):
+                k += 1
+            if k < n and _is_digit(PyUnicode_READ_CHAR(text, k)):
+                is_float = True
+                j = k + 1
+                while j < n and _is_digit(PyUnicode_READ_CHAR(text, j)):
+                    j += 1
+        if j < n:
+            ch = PyUnicode_READ_CHAR(text, j)
+            if _is_ident(ch) or ch == u'(' or ch == u'.':
+                raise ValueError("Invalid number")
+        self.pos = j
+        if is_float:
+            return float(text[start:j])
+        return int(text[start:j])
+
+    cdef object parse_word(self):
+        # T, F, N or a TypeName(payload) constructor
+        cdef unicode text = self.text
+        cdef Py_ssize_t start = self.pos
+        cdef Py_ssize_t end = start
+        cdef Py_ssize_t close
+        cdef Py_ssize_t i
+        cdef Py_UCS4 ch
+        while end < self.n and _is_ident(PyUnicode_READ_CHAR(text, end)):
+            end += 1
+        if end < self.n and PyUnicode_READ_CHAR(text, end) == u'(':
+            close = text.find(u')', end)
+            if close < 0:
+                raise ValueError("Unterminated constructor")
+            for i in range(end + 1, close):
+                ch = PyUnicode_READ_CHAR(text, i)
+                if ch == u'(' or ch == u' ' or ch == u'\t' or ch == u'\r' or ch == u'\n':
+                    raise ValueError("Invalid constructor payload")
+            self.pos = close + 1
+            return _constructor(text[start:end], text[end + 1:close])
+        self.pos = end
+        if end - start == 1:
+            ch = PyUnicode_READ_CHAR(text, start)
+            if ch == u'T':
+                return True
+            elif ch == u'F':
+                return False
+            elif ch == u'N':
+                return None
+        raise ValueError("Unexpected identifier in value position")
+
+
+def loads(unicode text):
+    return _Parser(text).parse()
+
+
+cdef int _write(object obj, list out, Py_ssize_t depth) except -1:
+    cdef unicode sep
+    if isinstance(obj, (dict, list)) and depth >= MAX_DEPTH:
+        raise ValueError("Maximum nesting depth exceeded")
+    if isinstance(obj, dict):
+        out.append(u'{')
+        sep = u''
+        for k, v in (<dict>obj).items():
+            out.append(sep)
+            out.append(k if type(k) is str else str(k))
+            out.append(u': ')
+            _write(v, out, depth + 1)
+            sep = u', '
+        out.append(u'}')
+    elif isinstance(obj, list):
+        out.append(u'[')
+        sep = u''
+        for element in <list>obj:
+            out.append(sep)
+            _write(element, out, depth + 1)
+            sep = u', '
+        out.append(u']')
+    elif isinstance(obj, str):
+        out.append(u'`')
+        out.append(obj)
+        out.append(u'`')
+    elif obj is True:
+        out.append(u'T')
+    elif obj is False:
+        out.append(u'F')
+    elif obj is None:
+        out.append(u'N')
+    elif isinstance(obj, (int, float)):
+        out.append(str(obj))
+    elif isinstance(obj, (datetime, date)):
+        val = obj.isoformat()
+        if isinstance(obj, datetime) and obj.tzinfo:
+            val = val.replace(u'+00:00', u'Z')
+        out.append(f"D({val})")
+    elif isinstance(obj, bytes):
+        out.append(f"B({obj.hex().upper()})")
+    else:
+        raise TypeError(f"Unsupported type for serialization: {type(obj)}")
+    return 0
+
+
+def dumps(obj):
+    cdef list out = []
+    _write(obj, out, 0)
+    return u''.join(out)
@@ -64,8 +64,85 @@ def test_keys():
     assert parsed['_key'] is False
     assert parsed['Key9'] is None
 
+def test_keyword_prefixed_keys():
+    dtxt_text = "{ Tkey: 1, False_: 2, N0: 3 }"
+    parsed = dtxt.loads(dtxt_text)
+    assert parsed == {'Tkey': 1, 'False_': 2, 'N0': 3}
+
+def test_numeric_keys():
+    parsed = dtxt.loads("{ 123: `a`, 0: `b`, 1e5: `c` }")
+    assert parsed == {'123': 'a', '0': 'b', '1e5': 'c'}
+
+def test_dumps_key_order():
+    obj = {'b': 1, 'a': {'d': True, 'c': None}}
+    assert dtxt.dumps(obj) == "{b: 1, a: {d: T, c: N}}"
+    assert dtxt.dumps_canonical(obj) == "{a: {c: N, d: T}, b: 1}"
+
+def test_duplicate_keys():
+    for dtxt_text in ("{ a: 1, a: 2 }", "{ a: 1, b: { c: 1, c: 1 } }"):
+        try:
+            dtxt.loads(dtxt_text)
+        except dtxt.DTXTError as e:
+            assert "Duplicate key" in str(e)
+        else:
+            assert False, f"Expected duplicate key error for {dtxt_text!r}"
+
+def test_dumps_canonical_indent():
+    obj = {'b': [1, {}], 'a': {'c': 'x'}}
+    expected = "{\n  a: {\n    c: `x`,\n  },\n  b: [\n    1,\n    {},\n  ],\n}"
+    assert dtxt.dumps_canonical(obj, indent=2) == expected
+    assert dtxt.loads(expected) == obj
+
+def test_dumps_primitive_lists():
+    obj = {'ints': [1, 2], 'strs': ['a', ''], 'bools': [1, True], 'mixed': ['a', 1]}
+    assert dtxt.dumps(obj) == "{ints: [1, 2], strs: [`a`, ``], bools: [1, T], mixed: [`a`, 1]}"
+
+def test_dumps_non_str_keys():
+    assert dtxt.dumps({1: 'a'}) == "{1: `a`}"
+    assert dtxt.dumps_canonical({'a': {2: 3}}) == "{a: {2: 3}}"
+
+def test_deep_nesting():
+    # Must raise a catchable error, whichever backend is active
+    deep_text = "{a:" + "[" * 100000 + "]" * 100000 + "}"
+    deep_list = []
+    for _ in range(200000):
+        deep_list = [deep_list]
+    for call, arg in ((dtxt.loads, deep_text), (dtxt.dumps, deep_list)):
+        try:
+            call(arg)
+        except RecursionError:
+            pass
+        else:
+            assert False, f"Expected RecursionError from {call.__name__}"
+
+def test_date_payload_shapes():
+    parsed = dtxt.loads("{ d: D(2026-01-15), compact: D(20260115), week: D(2026-W03-4) }")
+    assert parsed['d'] == date(2026, 1, 15)
+    # Other ISO 8601 forms stay strings regardless of Python version
+    assert parsed['compact'] == '20260115'
+    assert parsed['week'] == '2026-W03-4'
+
+def test_binary_payload_whitespace():
+    for dtxt_text in ("{ b: B(0A\x0b0B) }", "{ b: B(0A\x0c0B) }"):
+        try:
+            dtxt.loads(dtxt_text)
+        except dtxt.DTXTError as e:
+            assert "Invalid B(hex) payload" in str(e)
+        else:
+            assert False, f"Expected invalid payload error for {dtxt_text!r}"
+
 if __name__ == "__main__":
     test_spec_example()
     test_comments_and_whitespace()
     test_keys()
+    test_keyword_prefixed_keys()
+    test_numeric_keys()
+    test_dumps_key_order()
+    test_duplicate_keys()
+    test_dumps_canonical_indent()
+    test_dumps_primitive_lists()
+    test_dumps_non_str_keys()
+    test_deep_nesting()
+    test_date_payload_shapes()
+    test_binary_payload_whitespace()
     print("All tests passed!")
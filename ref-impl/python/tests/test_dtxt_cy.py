@@ -0,0 +1,80 @@
+import sys
+import os
+import json
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+# Only runs when the extension has been built: cythonize -i dtxt_cy.pyx
+dtxt_cy = pytest.importorskip("dtxt_cy")
+
+import dtxt
+from datetime import datetime, date, timezone
+
+TESTS_PATH = os.path.join(os.path.dirname(__file__), '../../../tests/conformance/tests.json')
+
+with open(TESTS_PATH, 'r', encoding='utf-8') as f:
+    CONFORMANCE_TESTS = json.load(f)
+
+EXTRA_INPUTS = [
+    "{ Tkey: 1, False_: 2, N0: 3, 123: 4, 1e5: 5 }",
+    "{ a: 1.5e-3, b: -0, c: 0.25, d: 12345678901234567890 }",
+    "{ d: D(2026-01-15), t: D(2026-01-15T10:30:00Z), bad: D(2026-1-5) }",
+    "{ d: D(20260115), w: D(2026-W03-4) }",
+    "{ b: B(), b2: B(ABC), bn: BN(-), bn2: BN(--1), x: BN(1e5) }",
+    "{ a: 1, b: { c: 1, c: 1 } }",
+    "{ a: `x` } // trailing\n",
+    "{ a: 1. }",
+    "{ a: 1 } /",
+    "{ b: B(0A\x0b0B) }",
+    "{ b: B(0A\x0c0B) }",
+]
+
+def parse_both(text):
+    try:
+        expected = ('ok', dtxt.DTXTParser(text).parse())
+    except dtxt.DTXTError:
+        expected = ('error',)
+    try:
+        actual = ('ok', dtxt_cy.loads(text))
+    except (ValueError, TypeError):
+        actual = ('error',)
+    return expected, actual
+
+@pytest.mark.parametrize(
+    "text", [t['input'] for t in CONFORMANCE_TESTS] + EXTRA_INPUTS)
+def test_loads_matches_pure_python(text):
+    expected, actual = parse_both(text)
+    assert actual == expected
+
+def test_dumps_matches_pure_python():
+    obj = {
+        'b': 1,
+        'a': [1, 2, True, None, 'x', 2.5, -0.0, 10 ** 30],
+        'tags': ['x', 'y'],
+        'nested': {'z': {}, 'y': [[]], 1: 'int key'},
+        'when': [date(2026, 1, 15), datetime(2026, 1, 15, 10, 30, tzinfo=timezone.utc)],
+        'raw': b'\x01\xff',
+    }
+    out = []
+    dtxt._write(obj, out, False)
+    assert dtxt_cy.dumps(obj) == "".join(out)
+    assert dtxt_cy.loads(dtxt_cy.dumps({'k': obj['a']})) == {'k': obj['a']}
+
+def test_dumps_unsupported_type():
+    with pytest.raises(TypeError):
+        dtxt_cy.dumps({'a': object()})
+
+def test_deep_nesting_raises_value_error():
+    with pytest.raises(ValueError):
+        dtxt_cy.loads("{a:" + "[" * 100000 + "]" * 100000 + "}")
+    deep_list = []
+    for _ in range(200000):
+        deep_list = [deep_list]
+    with pytest.raises(ValueError):
+        dtxt_cy.dumps(deep_list)
+    # Nesting below the cap still parses
+    value = dtxt_cy.loads("{a:" + "[" * 500 + "]" * 500 + "}")['a']
+    for _ in range(499):
+        value, = value
+    assert value == []